@@ -1,7 +1,7 @@
 // ==UserScript==
 // @name         Letterboxd Top 2000
 // @namespace    https://github.com/frozenpandaman
-// @version      0.1 (2.1)
+// @version      0.1 (2.2)
 // @description  Shows the ranking of each of the top 2000 highest-rated & most popular movies.
 // @author       eli / frozenpandaman
 // @match        https://letterboxd.com/film/*
@@ -26,8 +26,50 @@ window.addEventListener('load', function (e) {
     getData(9, id, 'https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Ratings/top_100_scandinavian_films_by_scandinavian_users.json')
 }, false);
 
+const LIST_PARAMETERS = {
+    2: {
+        list: "/el_duderinno/list/every-movie-with-more-than-100000-watched/page/",
+        icon: "https://raw.githubusercontent.com/frozenpandaman/letterboxd-userscripts/master/top-2000-flame.svg",
+        size: {height: "12", width: "12"}
+    },
+    3: {
+        list: "/prof_ratigan/list/top-5000-films-of-all-time-calculated/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/camera_icon.png",
+        size: {height: "16", width: "16"}
+    },
+    4: {
+        list: "/el_duderinno/list/letterboxds-top-250-highest-rated-french-1/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/france.png",
+        size: {height: "16", width: "16"}
+    },
+    5: {
+        list: "/el_duderinno/list/letterboxds-top-250-spanish-speaking-films/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/spain.png",
+        size: {height: "16", width: "16"}
+    },
+    6: {
+        list: "/slinkyman/list/letterboxds-top-250-highest-rated-british/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/united_kingdom.png",
+        size: {height: "16", width: "16"}
+    },
+    7: {
+        list: "/alexanderh/list/top-100-german-films-of-german-members/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/germany.png",
+        size: {height: "16", width: "16"}
+    },
+    8: {
+        list: "/el_duderinno/list/letterboxds-top-100-italian-films-as-rated/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/italy.png",
+        size: {height: "16", width: "16"}
+    },
+    9: {
+        list: "/el_duderinno/list/letterboxds-top-100-scandinavian-films-as/page/",
+        icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/scandinavia.png",
+        size: {height: "16", width: "16"}
+    }
+}
+
 let getData = function (type, id, json_link) {
-    var parameters;
 	fetch(json_link)
 		.then(res => res.json())
 		.then((out) => {
@@ -36,70 +78,10 @@ let getData = function (type, id, json_link) {
 					if (type == 1) {
 						 addCrown(i+1);
                     }
-					else if (type == 2) {
-                        parameters = {
-                            list: "/el_duderinno/list/every-movie-with-more-than-100000-watched/page/",
-                            icon: "https://raw.githubusercontent.com/frozenpandaman/letterboxd-userscripts/master/top-2000-flame.svg",
-                            size: {height: "12", width: "12"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 3) {
-                        parameters = {
-                            list: "/prof_ratigan/list/top-5000-films-of-all-time-calculated/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/camera_icon.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 4) {
-                        parameters = {
-                            list: "/el_duderinno/list/letterboxds-top-250-highest-rated-french-1/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/france.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 5) {
-                        parameters = {
-                            list: "/el_duderinno/list/letterboxds-top-250-spanish-speaking-films/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/spain.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 6) {
-                        parameters = {
-                            list: "/slinkyman/list/letterboxds-top-250-highest-rated-british/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/united_kingdom.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 7) {
-                        parameters = {
-                            list: "/alexanderh/list/top-100-german-films-of-german-members/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/germany.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 8) {
-                        parameters = {
-                            list: "/el_duderinno/list/letterboxds-top-100-italian-films-as-rated/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/italy.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
-                    }
-                    else if (type == 9) {
-                        parameters = {
-                            list: "/el_duderinno/list/letterboxds-top-100-scandinavian-films-as/page/",
-                            icon: "https://raw.githubusercontent.com/afchatfield/lb-list-to-json/main/Icons/scandinavia.png",
-                            size: {height: "16", width: "16"}
-                        }
-                        addIcon(i+1, parameters);
+					else {
+                        addIcon(i+1, LIST_PARAMETERS[type]);
                     }
+					return true;
 				}
 			});
 	});